@@ -6,6 +6,7 @@ It handles OAuth2 authentication, token management, and provides access to
 Falcon API service collections.
 """
 
+import asyncio
 import time
 from typing import Any
 
@@ -92,8 +93,8 @@ class CrowdStrikeProvider(BaseProvider):
                 base_url=self._settings.falcon_base_url,
             )
 
-            # Authenticate and get token
-            auth_result = self._oauth2.token()
+            # Authenticate and get token (blocking HTTP call, keep it off the loop)
+            auth_result = await asyncio.to_thread(self._oauth2.token)
 
             if not auth_result or auth_result.get("status_code") != 201:
                 error_msg = auth_result.get("body", {}).get(
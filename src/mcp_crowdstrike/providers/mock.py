@@ -112,6 +112,20 @@ class MockCrowdStrikeProvider(BaseProvider):
             }
         ]
 
+        # Seed optional address fields so consumers can subscript them directly
+        for device in self._sample_devices:
+            device.setdefault("local_ip", "N/A")
+            device.setdefault("external_ip", "N/A")
+
+        # Index records by ID once so lookups don't rescan the sample lists
+        self._devices_by_id = {d["device_id"]: d for d in self._sample_devices}
+        self._detections_by_id = {
+            d["detection_id"]: d for d in self._sample_detections
+        }
+        self._incidents_by_id = {
+            i["incident_id"]: i for i in self._sample_incidents
+        }
+
         logger.info("Mock CrowdStrike provider created (NO REAL CREDENTIALS NEEDED)")
 
     async def initialize(self) -> None:
@@ -192,7 +206,7 @@ class MockCrowdStrikeProvider(BaseProvider):
         limit = kwargs.get("limit", 100)
         offset = kwargs.get("offset", 0)
 
-        device_ids = [d["device_id"] for d in self._sample_devices]
+        device_ids = list(self._devices_by_id)
         paginated_ids = device_ids[offset : offset + limit]
 
         return {
@@ -217,7 +231,9 @@ class MockCrowdStrikeProvider(BaseProvider):
 
         requested_ids = kwargs.get("ids", [])
         devices = [
-            d for d in self._sample_devices if d["device_id"] in requested_ids
+            self._devices_by_id[did]
+            for did in dict.fromkeys(requested_ids)
+            if did in self._devices_by_id
         ]
 
         return {
@@ -258,7 +274,7 @@ class MockCrowdStrikeProvider(BaseProvider):
         limit = kwargs.get("limit", 100)
         offset = kwargs.get("offset", 0)
 
-        detection_ids = [d["detection_id"] for d in self._sample_detections]
+        detection_ids = list(self._detections_by_id)
         paginated_ids = detection_ids[offset : offset + limit]
 
         return {
@@ -283,7 +299,9 @@ class MockCrowdStrikeProvider(BaseProvider):
 
         requested_ids = kwargs.get("ids", [])
         detections = [
-            d for d in self._sample_detections if d["detection_id"] in requested_ids
+            self._detections_by_id[did]
+            for did in dict.fromkeys(requested_ids)
+            if did in self._detections_by_id
         ]
 
         return {
@@ -323,7 +341,7 @@ class MockCrowdStrikeProvider(BaseProvider):
         limit = kwargs.get("limit", 100)
         offset = kwargs.get("offset", 0)
 
-        incident_ids = [i["incident_id"] for i in self._sample_incidents]
+        incident_ids = list(self._incidents_by_id)
         paginated_ids = incident_ids[offset : offset + limit]
 
         return {
@@ -348,7 +366,9 @@ class MockCrowdStrikeProvider(BaseProvider):
 
         requested_ids = kwargs.get("ids", [])
         incidents = [
-            i for i in self._sample_incidents if i["incident_id"] in requested_ids
+            self._incidents_by_id[iid]
+            for iid in dict.fromkeys(requested_ids)
+            if iid in self._incidents_by_id
         ]
 
         return {
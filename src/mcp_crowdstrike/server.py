@@ -7,6 +7,7 @@ providing standardized access to CrowdStrike Falcon API tools.
 
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.types import Tool as MCPTool, TextContent
 
@@ -180,8 +181,7 @@ class MCPServer:
             result = await self._registry.execute_tool(name, arguments)
 
             # Convert result to MCP TextContent format
-            import json
-            result_text = json.dumps(result, indent=2)
+            result_text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
             return [
                 TextContent(
@@ -5,6 +5,8 @@ This module implements tools for querying and managing detections
 in CrowdStrike Falcon. Detections represent security events and alerts.
 """
 
+import functools
+from collections.abc import Mapping
 from typing import Any
 
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
@@ -30,15 +32,19 @@ VALID_STATUSES = [
     "reopened",
 ]
 
+# Same statuses as a set, for membership checks on every status update
+_VALID_STATUSES: frozenset[str] = frozenset(VALID_STATUSES)
 
-def get_tools() -> list[Tool]:
+
+@functools.lru_cache(maxsize=1)
+def get_tools() -> tuple[Tool, ...]:
     """
     Get all detection management tools.
 
     Returns:
-        list[Tool]: List of detection management tools
+        tuple[Tool, ...]: Tuple of detection management tools
     """
-    return [
+    return (
         Tool(
             name="query_detections",
             description=(
@@ -132,13 +138,13 @@ def get_tools() -> list[Tool]:
             },
             handler=lambda *args: None,
         ),
-    ]
+    )
 
 
 async def execute_tool(
     provider: CrowdStrikeProvider,
     tool_name: str,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Execute a detection management tool.
@@ -170,7 +176,7 @@ async def execute_tool(
 
 async def _query_detections(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Query detections using FQL filter.
@@ -256,7 +262,7 @@ async def _query_detections(
 
 async def _get_detection_details(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Get detailed detection information.
@@ -326,7 +332,7 @@ async def _get_detection_details(
 
 async def _update_detection_status(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Update detection status.
@@ -358,7 +364,7 @@ async def _update_detection_status(
             )
 
         # Validate status
-        if status not in VALID_STATUSES:
+        if status not in _VALID_STATUSES:
             return validation_error_response(
                 field="status",
                 message=f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}",
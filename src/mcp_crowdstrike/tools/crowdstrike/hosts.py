@@ -5,6 +5,8 @@ This module implements tools for querying and managing hosts (devices)
 in CrowdStrike Falcon. Includes critical security operations like host containment.
 """
 
+import functools
+from collections.abc import Mapping
 from typing import Any
 
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
@@ -20,14 +22,15 @@ from mcp_crowdstrike.utils.responses import (
 logger = get_logger(__name__)
 
 
-def get_tools() -> list[Tool]:
+@functools.lru_cache(maxsize=1)
+def get_tools() -> tuple[Tool, ...]:
     """
     Get all host management tools.
 
     Returns:
-        list[Tool]: List of host management tools
+        tuple[Tool, ...]: Tuple of host management tools
     """
-    return [
+    return (
         Tool(
             name="query_devices_by_filter",
             description=(
@@ -129,13 +132,13 @@ def get_tools() -> list[Tool]:
             },
             handler=lambda *args: None,
         ),
-    ]
+    )
 
 
 async def execute_tool(
     provider: CrowdStrikeProvider,
     tool_name: str,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Execute a host management tool.
@@ -169,7 +172,7 @@ async def execute_tool(
 
 async def _query_devices_by_filter(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Query devices using FQL filter.
@@ -255,7 +258,7 @@ async def _query_devices_by_filter(
 
 async def _get_device_details(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Get detailed device information.
@@ -325,7 +328,7 @@ async def _get_device_details(
 
 async def _contain_host(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Contain (isolate) a host from the network.
@@ -415,7 +418,7 @@ async def _contain_host(
 
 async def _lift_containment(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Lift containment (restore network access) for a host.
@@ -5,6 +5,8 @@ This module implements tools for querying and managing incidents
 in CrowdStrike Falcon. Incidents represent correlated security events.
 """
 
+import functools
+from collections.abc import Mapping
 from typing import Any
 
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
@@ -20,14 +22,15 @@ from mcp_crowdstrike.utils.responses import (
 logger = get_logger(__name__)
 
 
-def get_tools() -> list[Tool]:
+@functools.lru_cache(maxsize=1)
+def get_tools() -> tuple[Tool, ...]:
     """
     Get all incident management tools.
 
     Returns:
-        list[Tool]: List of incident management tools
+        tuple[Tool, ...]: Tuple of incident management tools
     """
-    return [
+    return (
         Tool(
             name="query_incidents",
             description=(
@@ -92,13 +95,13 @@ def get_tools() -> list[Tool]:
             },
             handler=lambda *args: None,
         ),
-    ]
+    )
 
 
 async def execute_tool(
     provider: CrowdStrikeProvider,
     tool_name: str,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Execute an incident management tool.
@@ -128,7 +131,7 @@ async def execute_tool(
 
 async def _query_incidents(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Query incidents using FQL filter.
@@ -214,7 +217,7 @@ async def _query_incidents(
 
 async def _get_incident_details(
     provider: CrowdStrikeProvider,
-    arguments: dict[str, Any],
+    arguments: Mapping[str, Any],
 ) -> dict[str, Any]:
     """
     Get detailed incident information.
@@ -5,6 +5,8 @@ This module provides a central registry for all available tools,
 handles tool discovery, and routes tool execution to the appropriate handlers.
 """
 
+import copy
+from collections.abc import Sequence
 from typing import Any, Callable
 
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
@@ -97,23 +99,26 @@ class ToolRegistry:
 
     def register_module(
         self,
-        get_tools_func: Callable[[], list[Tool]],
+        get_tools_func: Callable[[], Sequence[Tool]],
         execute_func: Callable[..., Any],
     ) -> None:
         """
         Register all tools from a module.
 
         Args:
-            get_tools_func: Function that returns list of tools
+            get_tools_func: Function that returns the module's tools
             execute_func: Function that executes tools from this module
         """
         tools = get_tools_func()
         for tool in tools:
+            # Modules cache their tool definitions, so bind the handler on a
+            # copy instead of mutating the shared instance
+            bound = copy.copy(tool)
             # Wrap the execute function with the module's handler
-            tool.handler = lambda name, args, func=execute_func: func(
+            bound.handler = lambda name, args, func=execute_func: func(
                 self._provider, name, args
             )
-            self.register_tool(tool)
+            self.register_tool(bound)
 
         logger.info(
             "Module registered",
@@ -15,6 +15,7 @@ INSTRUÇÕES:
 
 import asyncio
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add src to path for local development
@@ -25,49 +26,63 @@ from mcp_crowdstrike.providers.mock import MockCrowdStrikeProvider
 from mcp_crowdstrike.tools.crowdstrike import detections, hosts, incidents
 from pydantic import SecretStr
 
+SEP = "-" * 70
+
+
+def header(report: list[str], title: str) -> None:
+    """Adiciona o título da seção e o separador ao relatório."""
+    report.append(f"{title}\n{SEP}")
+
 
 async def demo_mode():
     """Demonstração completa do SDK com dados simulados."""
 
-    print("=" * 70)
-    print("🎯 MCP CROWDSTRIKE - MODO DEMONSTRAÇÃO (SEM CREDENCIAIS)")
-    print("=" * 70)
-    print()
-    print("✨ Este teste usa dados SIMULADOS - não precisa de credenciais reais!")
-    print("   Perfeito para demonstrar a funcionalidade do SDK.")
-    print()
-    print("=" * 70)
-    print()
+    # Todo o relatório é montado em memória e escrito de uma só vez no final
+    report: list[str] = []
+    out = report.append
+
+    out("=" * 70)
+    out("🎯 MCP CROWDSTRIKE - MODO DEMONSTRAÇÃO (SEM CREDENCIAIS)")
+    out("=" * 70)
+    out("")
+    out("✨ Este teste usa dados SIMULADOS - não precisa de credenciais reais!")
+    out("   Perfeito para demonstrar a funcionalidade do SDK.")
+    out("")
+    out("=" * 70)
+    out("")
 
     # Create mock provider (NO CREDENTIALS NEEDED!)
     provider = MockCrowdStrikeProvider()
     await provider.initialize()
 
     try:
+        # As três consultas são independentes: executa em paralelo
+        result, det_result, inc_result = await asyncio.gather(
+            hosts.execute_tool(provider, "query_devices_by_filter", {"limit": 10}),
+            detections.execute_tool(provider, "query_detections", {"limit": 10}),
+            incidents.execute_tool(provider, "query_incidents", {"limit": 10}),
+        )
+
         # ===================================================================
         # TESTE 1: Query de Dispositivos
         # ===================================================================
-        print("📱 TESTE 1: Consultando Dispositivos (Hosts)")
-        print("-" * 70)
-
-        result = await hosts.execute_tool(
-            provider, "query_devices_by_filter", {"limit": 10}
-        )
+        header(report, "📱 TESTE 1: Consultando Dispositivos (Hosts)")
 
+        device_ids: list[str] = []
         if result.get("success"):
-            device_ids = result["data"]["device_ids"]
-            total = result["metadata"]["total"]
+            data, meta = result["data"], result["metadata"]
+            device_ids = data["device_ids"]
+            total = meta["total"]
 
-            print(f"✓ Sucesso! Encontrados {total} dispositivos (simulados)")
-            print(f"  Device IDs: {device_ids}")
-            print()
+            out(f"✓ Sucesso! Encontrados {total} dispositivos (simulados)")
+            out(f"  Device IDs: {device_ids}")
+            out("")
 
             # ===================================================================
             # TESTE 2: Detalhes dos Dispositivos
             # ===================================================================
             if device_ids:
-                print("📋 TESTE 2: Obtendo Detalhes dos Dispositivos")
-                print("-" * 70)
+                header(report, "📋 TESTE 2: Obtendo Detalhes dos Dispositivos")
 
                 details = await hosts.execute_tool(
                     provider, "get_device_details", {"device_ids": device_ids}
@@ -75,33 +90,30 @@ async def demo_mode():
 
                 if details.get("success"):
                     devices = details["data"]["devices"]
-                    print(f"✓ Sucesso! Detalhes de {len(devices)} dispositivos:")
-                    print()
+                    out(f"✓ Sucesso! Detalhes de {len(devices)} dispositivos:")
+                    out("")
 
                     for device in devices:
-                        print(f"  🖥️  {device['hostname']}")
-                        print(f"     Platform: {device['platform_name']}")
-                        print(f"     OS: {device['os_version']}")
-                        print(f"     Status: {device['status']}")
-                        print(f"     IP Local: {device.get('local_ip', 'N/A')}")
-                        print(
-                            f"     IP Externo: {device.get('external_ip', 'N/A')}"
-                        )
-                        print(f"     Last Seen: {device['last_seen']}")
-                        print()
+                        out(f"  🖥️  {device['hostname']}")
+                        out(f"     Platform: {device['platform_name']}")
+                        out(f"     OS: {device['os_version']}")
+                        out(f"     Status: {device['status']}")
+                        out(f"     IP Local: {device['local_ip']}")
+                        out(f"     IP Externo: {device['external_ip']}")
+                        out(f"     Last Seen: {device['last_seen']}")
+                        out("")
                 else:
-                    print(f"✗ Erro: {details.get('error')}")
-                    print()
+                    out(f"✗ Erro: {details.get('error')}")
+                    out("")
 
         else:
-            print(f"✗ Erro: {result.get('error')}")
-            print()
+            out(f"✗ Erro: {result.get('error')}")
+            out("")
 
         # ===================================================================
         # TESTE 3: Containment (AÇÃO CRÍTICA - apenas simulado)
         # ===================================================================
-        print("⚠️  TESTE 3: Host Containment (SIMULADO - nenhuma ação real!)")
-        print("-" * 70)
+        header(report, "⚠️  TESTE 3: Host Containment (SIMULADO - nenhuma ação real!)")
 
         if device_ids:
             contain_result = await hosts.execute_tool(
@@ -109,43 +121,39 @@ async def demo_mode():
             )
 
             if contain_result.get("success"):
-                print(
+                out(
                     f"✓ Containment simulado com sucesso para: {device_ids[0]}"
                 )
-                print(f"  Status: {contain_result['data']['status']}")
-                print()
-                print(
+                out(f"  Status: {contain_result['data']['status']}")
+                out("")
+                out(
                     "  ℹ️  NOTA: Esta é uma SIMULAÇÃO. Nenhum host real foi isolado."
                 )
-                print()
+                out("")
             else:
-                print(f"✗ Erro: {contain_result.get('error')}")
-                print()
+                out(f"✗ Erro: {contain_result.get('error')}")
+                out("")
 
         # ===================================================================
         # TESTE 4: Query de Detecções
         # ===================================================================
-        print("🔍 TESTE 4: Consultando Detecções de Segurança")
-        print("-" * 70)
-
-        det_result = await detections.execute_tool(
-            provider, "query_detections", {"limit": 10}
-        )
+        header(report, "🔍 TESTE 4: Consultando Detecções de Segurança")
 
+        detection_ids: list[str] = []
         if det_result.get("success"):
-            detection_ids = det_result["data"]["detection_ids"]
-            total_detections = det_result["metadata"]["total"]
+            data, meta = det_result["data"], det_result["metadata"]
+            detection_ids = data["detection_ids"]
+            total_detections = meta["total"]
 
-            print(f"✓ Sucesso! Encontradas {total_detections} detecções (simuladas)")
-            print(f"  Detection IDs: {detection_ids}")
-            print()
+            out(f"✓ Sucesso! Encontradas {total_detections} detecções (simuladas)")
+            out(f"  Detection IDs: {detection_ids}")
+            out("")
 
             # ===================================================================
             # TESTE 5: Detalhes das Detecções
             # ===================================================================
             if detection_ids:
-                print("📊 TESTE 5: Obtendo Detalhes das Detecções")
-                print("-" * 70)
+                header(report, "📊 TESTE 5: Obtendo Detalhes das Detecções")
 
                 det_details = await detections.execute_tool(
                     provider,
@@ -155,33 +163,41 @@ async def demo_mode():
 
                 if det_details.get("success"):
                     dets = det_details["data"]["detections"]
-                    print(f"✓ Sucesso! Detalhes de {len(dets)} detecções:")
-                    print()
+                    out(f"✓ Sucesso! Detalhes de {len(dets)} detecções:")
+                    out("")
 
                     for det in dets:
-                        print(f"  🚨 {det['detection_id']}")
-                        print(f"     Status: {det['status']}")
-                        print(f"     Severidade: {det['severity']}")
-                        print(f"     Tática: {det['tactic']}")
-                        print(f"     Técnica: {det['technique']}")
-                        print(
+                        out(f"  🚨 {det['detection_id']}")
+                        out(f"     Status: {det['status']}")
+                        out(f"     Severidade: {det['severity']}")
+                        out(f"     Tática: {det['tactic']}")
+                        out(f"     Técnica: {det['technique']}")
+                        out(
                             f"     Host: {det['device']['hostname']}"
                         )
-                        print(f"     Criado: {det['created_timestamp']}")
-                        print()
+                        out(f"     Criado: {det['created_timestamp']}")
+                        out("")
+
+                    # Resumo por severidade em uma única passada
+                    severity_counts = Counter(det["severity"] for det in dets)
+                    summary = ", ".join(
+                        f"{severity}: {count}"
+                        for severity, count in severity_counts.most_common()
+                    )
+                    out(f"  Resumo por severidade: {summary}")
+                    out("")
                 else:
-                    print(f"✗ Erro: {det_details.get('error')}")
-                    print()
+                    out(f"✗ Erro: {det_details.get('error')}")
+                    out("")
 
         else:
-            print(f"✗ Erro: {det_result.get('error')}")
-            print()
+            out(f"✗ Erro: {det_result.get('error')}")
+            out("")
 
         # ===================================================================
         # TESTE 6: Update Detection Status (SIMULADO)
         # ===================================================================
-        print("✏️  TESTE 6: Atualizando Status de Detecção (SIMULADO)")
-        print("-" * 70)
+        header(report, "✏️  TESTE 6: Atualizando Status de Detecção (SIMULADO)")
 
         if detection_ids:
             update_result = await detections.execute_tool(
@@ -195,42 +211,38 @@ async def demo_mode():
             )
 
             if update_result.get("success"):
-                print(f"✓ Status atualizado com sucesso (simulado)")
-                print(f"  Detecção: {detection_ids[0]}")
-                print(f"  Novo status: false_positive")
-                print()
-                print(
+                out(f"✓ Status atualizado com sucesso (simulado)")
+                out(f"  Detecção: {detection_ids[0]}")
+                out(f"  Novo status: false_positive")
+                out("")
+                out(
                     "  ℹ️  NOTA: Esta é uma SIMULAÇÃO. Nenhuma detecção real foi alterada."
                 )
-                print()
+                out("")
             else:
-                print(f"✗ Erro: {update_result.get('error')}")
-                print()
+                out(f"✗ Erro: {update_result.get('error')}")
+                out("")
 
         # ===================================================================
         # TESTE 7: Query de Incidentes
         # ===================================================================
-        print("🎯 TESTE 7: Consultando Incidentes de Segurança")
-        print("-" * 70)
-
-        inc_result = await incidents.execute_tool(
-            provider, "query_incidents", {"limit": 10}
-        )
+        header(report, "🎯 TESTE 7: Consultando Incidentes de Segurança")
 
+        incident_ids: list[str] = []
         if inc_result.get("success"):
-            incident_ids = inc_result["data"]["incident_ids"]
-            total_incidents = inc_result["metadata"]["total"]
+            data, meta = inc_result["data"], inc_result["metadata"]
+            incident_ids = data["incident_ids"]
+            total_incidents = meta["total"]
 
-            print(f"✓ Sucesso! Encontrados {total_incidents} incidentes (simulados)")
-            print(f"  Incident IDs: {incident_ids}")
-            print()
+            out(f"✓ Sucesso! Encontrados {total_incidents} incidentes (simulados)")
+            out(f"  Incident IDs: {incident_ids}")
+            out("")
 
             # ===================================================================
             # TESTE 8: Detalhes dos Incidentes
             # ===================================================================
             if incident_ids:
-                print("📈 TESTE 8: Obtendo Detalhes dos Incidentes")
-                print("-" * 70)
+                header(report, "📈 TESTE 8: Obtendo Detalhes dos Incidentes")
 
                 inc_details = await incidents.execute_tool(
                     provider,
@@ -240,35 +252,34 @@ async def demo_mode():
 
                 if inc_details.get("success"):
                     incs = inc_details["data"]["incidents"]
-                    print(f"✓ Sucesso! Detalhes de {len(incs)} incidentes:")
-                    print()
+                    out(f"✓ Sucesso! Detalhes de {len(incs)} incidentes:")
+                    out("")
 
                     for inc in incs:
-                        print(f"  🎯 {inc['name']}")
-                        print(f"     ID: {inc['incident_id']}")
-                        print(f"     Status: {inc['status']}")
-                        print(f"     Estado: {inc['state']}")
-                        print(f"     Descrição: {inc['description']}")
-                        print(f"     Hosts afetados: {len(inc['hosts'])}")
-                        print(
+                        out(f"  🎯 {inc['name']}")
+                        out(f"     ID: {inc['incident_id']}")
+                        out(f"     Status: {inc['status']}")
+                        out(f"     Estado: {inc['state']}")
+                        out(f"     Descrição: {inc['description']}")
+                        out(f"     Hosts afetados: {len(inc['hosts'])}")
+                        out(
                             f"     Detecções relacionadas: {len(inc['detections'])}"
                         )
-                        print(f"     Táticas: {', '.join(inc['tactics'])}")
-                        print(f"     Início: {inc['start']}")
-                        print()
+                        out(f"     Táticas: {', '.join(inc['tactics'])}")
+                        out(f"     Início: {inc['start']}")
+                        out("")
                 else:
-                    print(f"✗ Erro: {inc_details.get('error')}")
-                    print()
+                    out(f"✗ Erro: {inc_details.get('error')}")
+                    out("")
 
         else:
-            print(f"✗ Erro: {inc_result.get('error')}")
-            print()
+            out(f"✗ Erro: {inc_result.get('error')}")
+            out("")
 
         # ===================================================================
         # TESTE 9: Lift Containment (SIMULADO)
         # ===================================================================
-        print("🔓 TESTE 9: Removendo Containment (SIMULADO)")
-        print("-" * 70)
+        header(report, "🔓 TESTE 9: Removendo Containment (SIMULADO)")
 
         if device_ids:
             lift_result = await hosts.execute_tool(
@@ -276,70 +287,78 @@ async def demo_mode():
             )
 
             if lift_result.get("success"):
-                print(f"✓ Containment removido com sucesso (simulado)")
-                print(f"  Device: {device_ids[0]}")
-                print(f"  Status: {lift_result['data']['status']}")
-                print()
-                print(
+                out(f"✓ Containment removido com sucesso (simulado)")
+                out(f"  Device: {device_ids[0]}")
+                out(f"  Status: {lift_result['data']['status']}")
+                out("")
+                out(
                     "  ℹ️  NOTA: Esta é uma SIMULAÇÃO. Nenhum host real foi liberado."
                 )
-                print()
+                out("")
             else:
-                print(f"✗ Erro: {lift_result.get('error')}")
-                print()
+                out(f"✗ Erro: {lift_result.get('error')}")
+                out("")
 
         # ===================================================================
         # RESUMO FINAL
         # ===================================================================
-        print("=" * 70)
-        print("✅ DEMONSTRAÇÃO COMPLETA!")
-        print("=" * 70)
-        print()
-        print("📊 Ferramentas Testadas:")
-        print("   ✓ 1. query_devices_by_filter - Buscar dispositivos")
-        print("   ✓ 2. get_device_details - Detalhes de dispositivos")
-        print("   ✓ 3. contain_host - Isolar host (CRÍTICO)")
-        print("   ✓ 4. lift_containment - Remover isolamento")
-        print("   ✓ 5. query_detections - Buscar detecções")
-        print("   ✓ 6. get_detection_details - Detalhes de detecções")
-        print("   ✓ 7. update_detection_status - Atualizar status")
-        print("   ✓ 8. query_incidents - Buscar incidentes")
-        print("   ✓ 9. get_incident_details - Detalhes de incidentes")
-        print()
-        print("🎯 Todas as 9 ferramentas funcionando perfeitamente!")
-        print()
-        print("=" * 70)
-        print("💡 PRÓXIMOS PASSOS:")
-        print("=" * 70)
-        print()
-        print("1. Para usar com dados REAIS do CrowdStrike:")
-        print("   → Veja o arquivo: test_sdk_example.py")
-        print("   → Você precisará de credenciais CrowdStrike")
-        print()
-        print("2. Para deploy em produção (servidor Docker):")
-        print("   → Veja o arquivo: VPS_DEPLOYMENT_PROMPT.md")
-        print("   → Modo servidor com health checks e API REST")
-        print()
-        print("3. Para integrar em seus scripts Python:")
-        print("   → Importe: from mcp_crowdstrike import CrowdStrikeClient")
-        print("   → Use as mesmas funções mostradas acima")
-        print()
-        print("=" * 70)
-        print()
-        print("✨ Obrigado por testar o MCP CrowdStrike! ✨")
-        print()
-
+        out("=" * 70)
+        out("✅ DEMONSTRAÇÃO COMPLETA!")
+        out("=" * 70)
+        out("")
+        out("📊 Ferramentas Testadas:")
+        out("   ✓ 1. query_devices_by_filter - Buscar dispositivos")
+        out("   ✓ 2. get_device_details - Detalhes de dispositivos")
+        out("   ✓ 3. contain_host - Isolar host (CRÍTICO)")
+        out("   ✓ 4. lift_containment - Remover isolamento")
+        out("   ✓ 5. query_detections - Buscar detecções")
+        out("   ✓ 6. get_detection_details - Detalhes de detecções")
+        out("   ✓ 7. update_detection_status - Atualizar status")
+        out("   ✓ 8. query_incidents - Buscar incidentes")
+        out("   ✓ 9. get_incident_details - Detalhes de incidentes")
+        out("")
+        out("🎯 Todas as 9 ferramentas funcionando perfeitamente!")
+        out("")
+        out("=" * 70)
+        out("💡 PRÓXIMOS PASSOS:")
+        out("=" * 70)
+        out("")
+        out("1. Para usar com dados REAIS do CrowdStrike:")
+        out("   → Veja o arquivo: test_sdk_example.py")
+        out("   → Você precisará de credenciais CrowdStrike")
+        out("")
+        out("2. Para deploy em produção (servidor Docker):")
+        out("   → Veja o arquivo: VPS_DEPLOYMENT_PROMPT.md")
+        out("   → Modo servidor com health checks e API REST")
+        out("")
+        out("3. Para integrar em seus scripts Python:")
+        out("   → Importe: from mcp_crowdstrike import CrowdStrikeClient")
+        out("   → Use as mesmas funções mostradas acima")
+        out("")
+        out("=" * 70)
+        out("")
+        out("✨ Obrigado por testar o MCP CrowdStrike! ✨")
+        out("")
     finally:
+        # Mostra o relatório antes do shutdown, que pode falhar
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
         await provider.shutdown()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is written and flushed explicitly
+    sys.stdout.reconfigure(line_buffering=False)
+
     print()
     print("🚀 Iniciando demonstração do MCP CrowdStrike...")
     print()
 
     try:
-        asyncio.run(demo_mode())
+        # One Runner owns the event loop; further demos can reuse it via
+        # additional runner.run() calls instead of paying loop setup again
+        with asyncio.Runner() as runner:
+            runner.run(demo_mode())
     except KeyboardInterrupt:
         print()
         print("⚠️  Demonstração interrompida pelo usuário.")
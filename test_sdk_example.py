@@ -9,8 +9,18 @@ INSTRUÇÕES:
 """
 
 import asyncio
+from contextlib import AsyncExitStack
+
 from mcp_crowdstrike import CrowdStrikeClient
 
+# Regiões da API CrowdStrike
+REGION_URLS = {
+    "US-1": "https://api.crowdstrike.com",
+    "US-2": "https://api.us-2.crowdstrike.com",
+    "EU-1": "https://api.eu-1.crowdstrike.com",
+    "US-GOV": "https://api.laggar.gcw.crowdstrike.com",
+}
+
 
 async def test_crowdstrike_sdk():
     """Teste básico do SDK CrowdStrike."""
@@ -21,12 +31,8 @@ async def test_crowdstrike_sdk():
     client_id = "YOUR_CLIENT_ID_HERE"
     client_secret = "YOUR_CLIENT_SECRET_HERE"
 
-    # Região da API (opcional - padrão é US-1)
-    # US-1: https://api.crowdstrike.com
-    # US-2: https://api.us-2.crowdstrike.com
-    # EU-1: https://api.eu-1.crowdstrike.com
-    # US-GOV: https://api.laggar.gcw.crowdstrike.com
-    base_url = "https://api.crowdstrike.com"
+    # Região da API (opcional - padrão é US-1, veja REGION_URLS)
+    base_url = REGION_URLS["US-1"]
 
     print("=" * 60)
     print("MCP CrowdStrike SDK - Teste de Conexão")
@@ -146,6 +152,55 @@ async def test_crowdstrike_sdk():
         traceback.print_exc()
 
 
+async def test_multi_region(client_id, client_secret, regions):
+    """Consulta dispositivos em várias regiões ao mesmo tempo."""
+
+    print("=" * 60)
+    print(f"MCP CrowdStrike SDK - Multi-Região ({', '.join(regions)})")
+    print("=" * 60)
+    print()
+
+    clients = [
+        CrowdStrikeClient(
+            client_id=client_id,
+            client_secret=client_secret,
+            base_url=REGION_URLS[region],
+        )
+        for region in regions
+    ]
+
+    async with AsyncExitStack() as stack:
+        # Autentica em todas as regiões em paralelo e espera todas terminarem
+        # antes de seguir, para registrar o fechamento de cada cliente que
+        # conectou; se alguma falhar, o stack fecha os que conectaram
+        outcomes = await asyncio.gather(
+            *(client.initialize() for client in clients),
+            return_exceptions=True,
+        )
+        for client, outcome in zip(clients, outcomes):
+            if not isinstance(outcome, BaseException):
+                stack.push_async_callback(client.close)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        results = await asyncio.gather(
+            *(client.query_devices_by_filter(limit=5) for client in clients)
+        )
+
+    for region, result in zip(regions, results):
+        if result.get("success"):
+            print(f"✓ {region}: {result['metadata']['total']} dispositivos")
+        else:
+            print(f"✗ {region}: {result.get('error')}")
+    print()
+
+
 if __name__ == "__main__":
     # Executar teste
     asyncio.run(test_crowdstrike_sdk())
+
+    # Para consultar várias regiões em paralelo, descomente e preencha:
+    # asyncio.run(
+    #     test_multi_region("YOUR_CLIENT_ID_HERE", "YOUR_CLIENT_SECRET_HERE", ["US-1", "EU-1"])
+    # )
@@ -8,17 +8,87 @@ This module provides reusable fixtures for testing, including:
 - Test clients
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import copy
+import functools
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
-from fastapi.testclient import TestClient
 from pydantic import SecretStr
+from pytest_asyncio import is_async_test
 
 from mcp_crowdstrike.config import Settings
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
 
+SAMPLE_DATA_PATH = Path(__file__).parent / "fixtures" / "sample_data.json"
 
-@pytest.fixture
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists into read-only equivalents.
+
+    Args:
+        value: Value to freeze
+
+    Returns:
+        Any: MappingProxyType for dicts, tuple for lists, value otherwise
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """
+    Recursively copy frozen data back into plain dicts and lists.
+
+    Mocked API responses are built from these copies so the tools under
+    test see the same shapes FalconPy returns.
+
+    Args:
+        value: Value to thaw
+
+    Returns:
+        Any: dict for mappings, list for tuples, value otherwise
+    """
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _load_samples() -> Mapping[str, Any]:
+    """
+    Load the sample API data shared by all tests.
+
+    Returns:
+        Mapping[str, Any]: Frozen sample data keyed by resource type
+    """
+    return _freeze(json.loads(SAMPLE_DATA_PATH.read_text(encoding="utf-8")))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Run every async test on the session-wide event loop.
+
+    Args:
+        items: Collected test items
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """
     Create test settings with mock credentials.
@@ -37,204 +107,190 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
-def mock_crowdstrike_provider(test_settings: Settings) -> CrowdStrikeProvider:
+@pytest.fixture(scope="session")
+def master_crowdstrike_provider(test_settings: Settings) -> CrowdStrikeProvider:
     """
-    Create a mock CrowdStrike provider for testing.
+    Create the mocked CrowdStrike provider once per test session.
+
+    Tests receive shallow copies through ``mock_crowdstrike_provider``;
+    the mocked service collections are shared between those copies.
 
     Args:
         test_settings: Test settings fixture
 
     Returns:
-        CrowdStrikeProvider: Mocked provider
+        CrowdStrikeProvider: Mocked provider template
     """
     provider = CrowdStrikeProvider(test_settings)
 
     # Mock OAuth2 client
-    provider._oauth2 = MagicMock()
-    provider._oauth2.token.return_value = {
-        "status_code": 201,
-        "body": {
-            "access_token": "mock-access-token",
-            "expires_in": 1800,
-        },
-    }
+    provider._oauth2 = SimpleNamespace(
+        token=Mock(
+            return_value={
+                "status_code": 201,
+                "body": {
+                    "access_token": "mock-access-token",
+                    "expires_in": 1800,
+                },
+            }
+        )
+    )
 
-    # Mock service collections
-    provider._hosts = MagicMock()
-    provider._detects = MagicMock()
-    provider._incidents = MagicMock()
+    # Mock service collections; only the methods the tools call are stubbed,
+    # and the API fixtures below fill in their return values
+    provider._hosts = SimpleNamespace(
+        query_devices_by_filter=Mock(),
+        get_device_details=Mock(),
+        perform_action=Mock(),
+    )
+    provider._detects = SimpleNamespace(
+        query_detects=Mock(),
+        get_detect_summaries=Mock(),
+        update_detects_by_ids=Mock(),
+    )
+    provider._incidents = SimpleNamespace(
+        query_incidents=Mock(),
+        get_incidents=Mock(),
+    )
     provider._initialized = True
 
+    # Keep the token valid so refresh_token_if_needed() never re-initializes
+    provider._token_expiry = float("inf")
+
     return provider
 
 
 @pytest.fixture
-def sample_device_data() -> dict:
+def mock_crowdstrike_provider(
+    master_crowdstrike_provider: CrowdStrikeProvider,
+) -> CrowdStrikeProvider:
     """
-    Create sample device data for testing.
+    Create a mock CrowdStrike provider for testing.
+
+    Args:
+        master_crowdstrike_provider: Session-wide mocked provider
 
     Returns:
-        dict: Sample device response data
-    """
-    return {
-        "device_ids": [
-            "device-id-1",
-            "device-id-2",
-            "device-id-3",
-        ],
-        "devices": [
-            {
-                "device_id": "device-id-1",
-                "hostname": "WIN-SERVER-01",
-                "platform_name": "Windows",
-                "os_version": "Windows Server 2019",
-                "local_ip": "192.168.1.100",
-                "external_ip": "203.0.113.100",
-                "status": "normal",
-                "last_seen": "2024-01-15T10:30:00Z",
-                "first_seen": "2024-01-01T08:00:00Z",
-                "agent_version": "7.10.0",
-            },
-            {
-                "device_id": "device-id-2",
-                "hostname": "LINUX-WEB-01",
-                "platform_name": "Linux",
-                "os_version": "Ubuntu 22.04",
-                "local_ip": "192.168.1.101",
-                "external_ip": "203.0.113.101",
-                "status": "normal",
-                "last_seen": "2024-01-15T10:25:00Z",
-                "first_seen": "2024-01-01T09:00:00Z",
-                "agent_version": "7.10.0",
-            },
-            {
-                "device_id": "device-id-3",
-                "hostname": "MAC-LAPTOP-01",
-                "platform_name": "Mac",
-                "os_version": "macOS 14.0",
-                "local_ip": "192.168.1.102",
-                "status": "contained",
-                "last_seen": "2024-01-15T10:20:00Z",
-                "first_seen": "2024-01-05T14:00:00Z",
-                "agent_version": "7.09.0",
-            },
-        ],
-    }
+        CrowdStrikeProvider: Shallow copy of the mocked provider
+    """
+    return copy.copy(master_crowdstrike_provider)
 
 
-@pytest.fixture
-def sample_detection_data() -> dict:
+@pytest.fixture(scope="session")
+def thaw() -> Callable[[Any], Any]:
     """
-    Create sample detection data for testing.
+    Provide the helper that copies frozen sample data into plain dicts and lists.
 
     Returns:
-        dict: Sample detection response data
-    """
-    return {
-        "detection_ids": [
-            "ldt:detection-id-1",
-            "ldt:detection-id-2",
-        ],
-        "detections": [
-            {
-                "detection_id": "ldt:detection-id-1",
-                "status": "new",
-                "severity": "high",
-                "tactic": "Initial Access",
-                "technique": "Phishing",
-                "device": {
-                    "device_id": "device-id-1",
-                    "hostname": "WIN-SERVER-01",
-                },
-                "created_timestamp": "2024-01-15T09:00:00Z",
-                "first_behavior": "2024-01-15T08:55:00Z",
-                "last_behavior": "2024-01-15T09:00:00Z",
-            },
-            {
-                "detection_id": "ldt:detection-id-2",
-                "status": "in_progress",
-                "severity": "medium",
-                "tactic": "Execution",
-                "technique": "PowerShell",
-                "device": {
-                    "device_id": "device-id-2",
-                    "hostname": "LINUX-WEB-01",
-                },
-                "created_timestamp": "2024-01-15T10:00:00Z",
-                "first_behavior": "2024-01-15T09:55:00Z",
-                "last_behavior": "2024-01-15T10:00:00Z",
-            },
-        ],
-    }
+        Callable: Function taking frozen data and returning a mutable copy
+    """
+    return _thaw
 
 
 @pytest.fixture
-def sample_incident_data() -> dict:
+def call_tool(
+    mock_crowdstrike_provider: CrowdStrikeProvider,
+) -> Callable[..., Awaitable[dict[str, Any]]]:
     """
-    Create sample incident data for testing.
+    Provide a helper that runs a tool entry point against the mocked provider.
+
+    Args:
+        mock_crowdstrike_provider: Mocked provider for this test
 
     Returns:
-        dict: Sample incident response data
-    """
-    return {
-        "incident_ids": [
-            "inc:incident-id-1",
-            "inc:incident-id-2",
-        ],
-        "incidents": [
-            {
-                "incident_id": "inc:incident-id-1",
-                "status": "New",
-                "state": "open",
-                "name": "Suspicious Activity on WIN-SERVER-01",
-                "description": "Multiple detections indicating potential compromise",
-                "hosts": ["device-id-1"],
-                "detections": ["ldt:detection-id-1"],
-                "start": "2024-01-15T08:55:00Z",
-                "end": "2024-01-15T09:00:00Z",
-                "tactics": ["Initial Access", "Execution"],
-                "techniques": ["Phishing", "PowerShell"],
-            },
-            {
-                "incident_id": "inc:incident-id-2",
-                "status": "In Progress",
-                "state": "open",
-                "name": "Malware Detected on Multiple Hosts",
-                "description": "Widespread malware infection detected",
-                "hosts": ["device-id-1", "device-id-2"],
-                "detections": ["ldt:detection-id-1", "ldt:detection-id-2"],
-                "start": "2024-01-15T09:00:00Z",
-                "end": "2024-01-15T10:00:00Z",
-                "tactics": ["Initial Access", "Persistence"],
-                "techniques": ["Phishing", "Registry Run Keys"],
-            },
-        ],
-    }
+        Callable: Coroutine function taking (execute, tool_name, arguments),
+            where execute is a tool module's execute_tool
+    """
 
+    async def _call(
+        execute: Callable[..., Awaitable[dict[str, Any]]],
+        tool_name: str,
+        arguments: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        return await execute(
+            mock_crowdstrike_provider,
+            tool_name,
+            arguments,
+        )
 
-@pytest.fixture
+    return _call
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(master_crowdstrike_provider: CrowdStrikeProvider) -> None:
+    """
+    Clear call history on the shared service mocks before each test.
+
+    Configured return values are kept, so the session-scoped API fixtures
+    only need to set them up once.
+
+    Args:
+        master_crowdstrike_provider: Session-wide mocked provider
+    """
+    for api in (
+        master_crowdstrike_provider._hosts,
+        master_crowdstrike_provider._detects,
+        master_crowdstrike_provider._incidents,
+    ):
+        for method in vars(api).values():
+            method.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def sample_device_data() -> Mapping[str, Any]:
+    """
+    Provide sample device data for testing.
+
+    Returns:
+        Mapping[str, Any]: Read-only sample device response data
+    """
+    return _load_samples()["devices"]
+
+
+@pytest.fixture(scope="session")
+def sample_detection_data() -> Mapping[str, Any]:
+    """
+    Provide sample detection data for testing.
+
+    Returns:
+        Mapping[str, Any]: Read-only sample detection response data
+    """
+    return _load_samples()["detections"]
+
+
+@pytest.fixture(scope="session")
+def sample_incident_data() -> Mapping[str, Any]:
+    """
+    Provide sample incident data for testing.
+
+    Returns:
+        Mapping[str, Any]: Read-only sample incident response data
+    """
+    return _load_samples()["incidents"]
+
+
+@pytest.fixture(scope="session")
 def mock_hosts_api(
-    mock_crowdstrike_provider: CrowdStrikeProvider,
-    sample_device_data: dict,
-) -> MagicMock:
+    master_crowdstrike_provider: CrowdStrikeProvider,
+    sample_device_data: Mapping[str, Any],
+) -> SimpleNamespace:
     """
     Configure mock Hosts API responses.
 
     Args:
-        mock_crowdstrike_provider: Mock provider fixture
+        master_crowdstrike_provider: Session-wide mocked provider
         sample_device_data: Sample device data
 
     Returns:
-        MagicMock: Configured mock Hosts API
+        SimpleNamespace: Configured mock Hosts API
     """
-    hosts_api = mock_crowdstrike_provider._hosts
+    hosts_api = master_crowdstrike_provider._hosts
 
     # Mock query_devices_by_filter
     hosts_api.query_devices_by_filter.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_device_data["device_ids"],
+            "resources": _thaw(sample_device_data["device_ids"]),
             "meta": {
                 "pagination": {
                     "total": len(sample_device_data["device_ids"]),
@@ -247,7 +303,7 @@ def mock_hosts_api(
     hosts_api.get_device_details.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_device_data["devices"],
+            "resources": _thaw(sample_device_data["devices"]),
         },
     }
 
@@ -262,28 +318,28 @@ def mock_hosts_api(
     return hosts_api
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_detects_api(
-    mock_crowdstrike_provider: CrowdStrikeProvider,
-    sample_detection_data: dict,
-) -> MagicMock:
+    master_crowdstrike_provider: CrowdStrikeProvider,
+    sample_detection_data: Mapping[str, Any],
+) -> SimpleNamespace:
     """
     Configure mock Detections API responses.
 
     Args:
-        mock_crowdstrike_provider: Mock provider fixture
+        master_crowdstrike_provider: Session-wide mocked provider
         sample_detection_data: Sample detection data
 
     Returns:
-        MagicMock: Configured mock Detections API
+        SimpleNamespace: Configured mock Detections API
     """
-    detects_api = mock_crowdstrike_provider._detects
+    detects_api = master_crowdstrike_provider._detects
 
     # Mock query_detects
     detects_api.query_detects.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_detection_data["detection_ids"],
+            "resources": _thaw(sample_detection_data["detection_ids"]),
             "meta": {
                 "pagination": {
                     "total": len(sample_detection_data["detection_ids"]),
@@ -296,7 +352,7 @@ def mock_detects_api(
     detects_api.get_detect_summaries.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_detection_data["detections"],
+            "resources": _thaw(sample_detection_data["detections"]),
         },
     }
 
@@ -304,35 +360,35 @@ def mock_detects_api(
     detects_api.update_detects_by_ids.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_detection_data["detection_ids"],
+            "resources": _thaw(sample_detection_data["detection_ids"]),
         },
     }
 
     return detects_api
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_incidents_api(
-    mock_crowdstrike_provider: CrowdStrikeProvider,
-    sample_incident_data: dict,
-) -> MagicMock:
+    master_crowdstrike_provider: CrowdStrikeProvider,
+    sample_incident_data: Mapping[str, Any],
+) -> SimpleNamespace:
     """
     Configure mock Incidents API responses.
 
     Args:
-        mock_crowdstrike_provider: Mock provider fixture
+        master_crowdstrike_provider: Session-wide mocked provider
         sample_incident_data: Sample incident data
 
     Returns:
-        MagicMock: Configured mock Incidents API
+        SimpleNamespace: Configured mock Incidents API
     """
-    incidents_api = mock_crowdstrike_provider._incidents
+    incidents_api = master_crowdstrike_provider._incidents
 
     # Mock query_incidents
     incidents_api.query_incidents.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_incident_data["incident_ids"],
+            "resources": _thaw(sample_incident_data["incident_ids"]),
             "meta": {
                 "pagination": {
                     "total": len(sample_incident_data["incident_ids"]),
@@ -345,25 +401,56 @@ def mock_incidents_api(
     incidents_api.get_incidents.return_value = {
         "status_code": 200,
         "body": {
-            "resources": sample_incident_data["incidents"],
+            "resources": _thaw(sample_incident_data["incidents"]),
         },
     }
 
     return incidents_api
 
 
-@pytest.fixture
-def async_test_client(test_settings: Settings) -> TestClient:
+@pytest.fixture(scope="session")
+def api_error_400() -> Mapping[str, Any]:
     """
-    Create a FastAPI test client for integration tests.
+    Provide a Falcon API 400 Bad Request response.
 
-    Args:
-        test_settings: Test settings fixture
+    Returns:
+        Mapping[str, Any]: Read-only error response
+    """
+    return _freeze(
+        {
+            "status_code": 400,
+            "body": {"errors": ["Bad request"]},
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def api_error_404() -> Mapping[str, Any]:
+    """
+    Provide a Falcon API 404 Not Found response.
 
     Returns:
-        TestClient: FastAPI test client
+        Mapping[str, Any]: Read-only error response
     """
-    # Import here to avoid circular imports
-    from mcp_crowdstrike.main import app
+    return _freeze(
+        {
+            "status_code": 404,
+            "body": {"errors": ["Not found"]},
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def api_error_500() -> Mapping[str, Any]:
+    """
+    Provide a Falcon API 500 Internal Server Error response.
 
-    return TestClient(app)
+    Returns:
+        Mapping[str, Any]: Read-only error response
+    """
+    return _freeze(
+        {
+            "status_code": 500,
+            "body": {"errors": ["Internal server error"]},
+        }
+    )
@@ -0,0 +1 @@
+"""Provider tests for MCP CrowdStrike."""
@@ -0,0 +1,61 @@
+"""
+Tests for the CrowdStrike Falcon API provider.
+
+This module tests provider initialization against stubbed FalconPy clients.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import ExitStack
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_crowdstrike.config import Settings
+from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
+
+_FALCONPY = "mcp_crowdstrike.providers.crowdstrike"
+
+
+@pytest.fixture
+def falconpy_classes() -> Iterator[dict[str, MagicMock]]:
+    """
+    Patch the FalconPy classes the provider constructs.
+
+    Yields:
+        dict[str, MagicMock]: Patched classes keyed by name
+    """
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(patch(f"{_FALCONPY}.{name}"))
+            for name in ("OAuth2", "Hosts", "Detects", "Incidents")
+        }
+
+
+async def test_initialize_fetches_token_off_the_event_loop(
+    test_settings: Settings,
+    falconpy_classes: dict[str, MagicMock],
+) -> None:
+    """Test the blocking OAuth2 token call runs in a worker thread."""
+    token_threads: list[int] = []
+
+    def _token() -> dict[str, Any]:
+        token_threads.append(threading.get_ident())
+        return {
+            "status_code": 201,
+            "body": {"access_token": "token", "expires_in": 1800},
+        }
+
+    falconpy_classes["OAuth2"].return_value.token.side_effect = _token
+    provider = CrowdStrikeProvider(test_settings)
+
+    await provider.initialize()
+
+    assert provider._initialized
+    assert token_threads
+    assert token_threads[0] != threading.get_ident()
+    falconpy_classes["Hosts"].assert_called_once_with(
+        access_token="token",
+        base_url=test_settings.falcon_base_url,
+    )
@@ -4,13 +4,143 @@ Tests for CrowdStrike SDK client.
 This module tests the SDK client functionality for programmatic usage.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from mcp_crowdstrike.sdk import CrowdStrikeClient
 
 
+class _FakeExecuteTool:
+    """
+    Plain coroutine stand-in for a tool module's ``execute_tool``.
+
+    Attributes:
+        return_value: Result returned by every call
+        calls: ``(tool_name, arguments)`` for each call made
+    """
+
+    def __init__(self) -> None:
+        self.return_value: dict[str, Any] = {}
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def __call__(
+        self,
+        provider: Any,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> dict[str, Any]:
+        self.calls.append((tool_name, arguments))
+        return self.return_value
+
+
+SDKClientFactory = Callable[
+    [str, dict[str, Any]],
+    tuple[CrowdStrikeClient, _FakeExecuteTool],
+]
+
+
+@pytest.fixture(scope="module")
+def fake_execute_tools() -> Iterator[dict[str, _FakeExecuteTool]]:
+    """
+    Patch ``execute_tool`` of each SDK tool module once for this module.
+
+    Yields:
+        dict[str, _FakeExecuteTool]: Fakes keyed by tool module name
+    """
+    fakes = {module: _FakeExecuteTool() for module in ("hosts", "detections")}
+    with ExitStack() as stack:
+        for module, fake in fakes.items():
+            stack.enter_context(
+                patch(f"mcp_crowdstrike.sdk.{module}.execute_tool", fake)
+            )
+        yield fakes
+
+
+@pytest.fixture(scope="session")
+def sdk_client_template() -> CrowdStrikeClient:
+    """
+    Construct (and validate settings for) one SDK client per session.
+
+    Returns:
+        CrowdStrikeClient: Uninitialized client used as a copy template
+    """
+    return CrowdStrikeClient(
+        client_id="test-id",
+        client_secret="test-secret",
+    )
+
+
+@pytest.fixture
+def sdk_client(sdk_client_template: CrowdStrikeClient) -> CrowdStrikeClient:
+    """
+    Provide a fresh uninitialized SDK client backed by a mocked provider.
+
+    Args:
+        sdk_client_template: Session-wide client template
+
+    Returns:
+        CrowdStrikeClient: Shallow copy of the template
+    """
+    client = copy.copy(sdk_client_template)
+    client._initialized = False
+    client._provider = AsyncMock()
+    return client
+
+
+@pytest.fixture(scope="session")
+def initialized_sdk_client(
+    sdk_client_template: CrowdStrikeClient,
+) -> CrowdStrikeClient:
+    """
+    Provide an already-initialized SDK client backed by a mocked provider.
+
+    Args:
+        sdk_client_template: Session-wide client template
+
+    Returns:
+        CrowdStrikeClient: Initialized shallow copy of the template
+    """
+    client = copy.copy(sdk_client_template)
+    client._provider = AsyncMock()
+    client._initialized = True
+    return client
+
+
+@pytest.fixture
+def sdk_client_factory(
+    initialized_sdk_client: CrowdStrikeClient,
+    fake_execute_tools: dict[str, _FakeExecuteTool],
+) -> SDKClientFactory:
+    """
+    Configure the faked ``execute_tool`` for an initialized SDK client.
+
+    Args:
+        initialized_sdk_client: Session-wide initialized SDK client
+        fake_execute_tools: Module-wide ``execute_tool`` fakes
+
+    Returns:
+        SDKClientFactory: Factory taking the tool module name and the
+        ``execute_tool`` return value, returning ``(client, fake_execute)``
+    """
+    for fake in fake_execute_tools.values():
+        fake.calls.clear()
+
+    def _factory(
+        module: str,
+        return_value: dict[str, Any],
+    ) -> tuple[CrowdStrikeClient, _FakeExecuteTool]:
+        fake_execute = fake_execute_tools[module]
+        fake_execute.return_value = return_value
+        return initialized_sdk_client, fake_execute
+
+    return _factory
+
+
 class TestSDKClient:
     """Tests for CrowdStrike SDK client."""
 
@@ -26,250 +156,103 @@ class TestSDKClient:
         assert not client._initialized
 
     @pytest.mark.asyncio
-    async def test_client_context_manager(self) -> None:
+    async def test_client_context_manager(
+        self,
+        sdk_client: CrowdStrikeClient,
+    ) -> None:
         """Test SDK client as context manager."""
-        with patch.object(
-            CrowdStrikeClient,
-            "initialize",
-            new_callable=AsyncMock,
-        ) as mock_init, patch.object(
-            CrowdStrikeClient,
-            "close",
-            new_callable=AsyncMock,
-        ) as mock_close:
-            async with CrowdStrikeClient(
-                client_id="test-id",
-                client_secret="test-secret",
-            ) as client:
+        with ExitStack() as stack:
+            mock_init = stack.enter_context(
+                patch.object(CrowdStrikeClient, "initialize", new_callable=AsyncMock)
+            )
+            mock_close = stack.enter_context(
+                patch.object(CrowdStrikeClient, "close", new_callable=AsyncMock)
+            )
+
+            async with sdk_client as client:
                 assert client is not None
 
             mock_init.assert_called_once()
             mock_close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_query_devices_by_filter(
-        self,
-        sample_device_data: dict,
-    ) -> None:
-        """Test query_devices_by_filter method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
-
-        # Mock provider and tools
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.hosts.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "device_ids": sample_device_data["device_ids"],
-                },
-            }
-
-            await client.initialize()
-            result = await client.query_devices_by_filter(limit=10)
-
-            assert result["success"] is True
-            assert "device_ids" in result["data"]
-            mock_execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_device_details(
+    @pytest.mark.parametrize(
+        ("method_name", "module", "kwargs", "data"),
+        [
+            (
+                "query_devices_by_filter",
+                "hosts",
+                {"limit": 10},
+                {"device_ids": ["device-id-1", "device-id-2", "device-id-3"]},
+            ),
+            (
+                "get_device_details",
+                "hosts",
+                {"device_ids": ["device-id-1", "device-id-2"]},
+                {"devices": [{"device_id": "device-id-1"}]},
+            ),
+            (
+                "contain_host",
+                "hosts",
+                {"device_id": "device-id-1"},
+                {"device_id": "device-id-1", "action": "contained"},
+            ),
+            (
+                "lift_containment",
+                "hosts",
+                {"device_id": "device-id-1"},
+                {"device_id": "device-id-1", "action": "containment_lifted"},
+            ),
+            (
+                "query_detections",
+                "detections",
+                {"limit": 100},
+                {"detection_ids": ["ldt:detection-id-1", "ldt:detection-id-2"]},
+            ),
+            (
+                "update_detection_status",
+                "detections",
+                {"detection_ids": ["ldt:test"], "status": "false_positive"},
+                {"updated_count": 1, "status": "false_positive"},
+            ),
+        ],
+    )
+    async def test_sdk_method(
         self,
-        sample_device_data: dict,
+        sdk_client_factory: SDKClientFactory,
+        method_name: str,
+        module: str,
+        kwargs: dict[str, Any],
+        data: dict[str, Any],
     ) -> None:
-        """Test get_device_details method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
-
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.hosts.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "devices": sample_device_data["devices"],
-                },
-            }
-
-            await client.initialize()
-            result = await client.get_device_details(
-                device_ids=sample_device_data["device_ids"][:2]
-            )
-
-            assert result["success"] is True
-            assert "devices" in result["data"]
-
-    @pytest.mark.asyncio
-    async def test_contain_host(self) -> None:
-        """Test contain_host method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
+        """Test that SDK methods route to the matching tool and return its result."""
+        client, fake_execute = sdk_client_factory(
+            module,
+            {"success": True, "data": data},
         )
 
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.hosts.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "device_id": "device-id-1",
-                    "action": "contained",
-                },
-            }
-
-            await client.initialize()
-            result = await client.contain_host(device_id="device-id-1")
-
-            assert result["success"] is True
-            assert result["data"]["action"] == "contained"
-
-    @pytest.mark.asyncio
-    async def test_lift_containment(self) -> None:
-        """Test lift_containment method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
+        result = await getattr(client, method_name)(**kwargs)
 
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.hosts.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "device_id": "device-id-1",
-                    "action": "containment_lifted",
-                },
-            }
-
-            await client.initialize()
-            result = await client.lift_containment(device_id="device-id-1")
-
-            assert result["success"] is True
-            assert result["data"]["action"] == "containment_lifted"
+        assert result["success"] is True
+        assert result["data"] == data
+        assert len(fake_execute.calls) == 1
+        assert fake_execute.calls[0][0] == method_name
 
     @pytest.mark.asyncio
-    async def test_query_detections(
+    async def test_client_not_initialized_error(
         self,
-        sample_detection_data: dict,
+        sdk_client: CrowdStrikeClient,
     ) -> None:
-        """Test query_detections method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
-
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.detections.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "detection_ids": sample_detection_data["detection_ids"],
-                },
-            }
-
-            await client.initialize()
-            result = await client.query_detections(limit=100)
-
-            assert result["success"] is True
-            assert "detection_ids" in result["data"]
-
-    @pytest.mark.asyncio
-    async def test_update_detection_status(self) -> None:
-        """Test update_detection_status method."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
-
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch(
-            "mcp_crowdstrike.sdk.detections.execute_tool",
-            new_callable=AsyncMock,
-        ) as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "updated_count": 1,
-                    "status": "false_positive",
-                },
-            }
-
-            await client.initialize()
-            result = await client.update_detection_status(
-                detection_ids=["ldt:test"],
-                status="false_positive",
-            )
-
-            assert result["success"] is True
-            assert result["data"]["status"] == "false_positive"
-
-    @pytest.mark.asyncio
-    async def test_client_not_initialized_error(self) -> None:
         """Test that methods raise error when client not initialized."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
-
         with pytest.raises(RuntimeError, match="not initialized"):
-            await client.query_devices_by_filter()
+            await sdk_client.query_devices_by_filter()
 
     @pytest.mark.asyncio
-    async def test_client_close(self) -> None:
+    async def test_client_close(self, sdk_client: CrowdStrikeClient) -> None:
         """Test client cleanup."""
-        client = CrowdStrikeClient(
-            client_id="test-id",
-            client_secret="test-secret",
-        )
+        await sdk_client.initialize()
+        assert sdk_client._initialized
 
-        with patch.object(
-            client._provider,
-            "initialize",
-            new_callable=AsyncMock,
-        ), patch.object(
-            client._provider,
-            "shutdown",
-            new_callable=AsyncMock,
-        ) as mock_shutdown:
-            await client.initialize()
-            assert client._initialized
-
-            await client.close()
-            assert not client._initialized
-            mock_shutdown.assert_called_once()
+        await sdk_client.close()
+        assert not sdk_client._initialized
+        sdk_client._provider.shutdown.assert_called_once()
@@ -0,0 +1,89 @@
+"""
+Tests for the MCP protocol handlers.
+
+This module tests the handlers MCPServer registers on the MCP server.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from mcp_crowdstrike.config import Settings
+from mcp_crowdstrike.server import MCPServer
+
+_Handler = Callable[..., Awaitable[Any]]
+
+
+class _RecordingServer:
+    """MCP Server stand-in that keeps the decorated handlers."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, _Handler] = {}
+
+    def _record(self, kind: str) -> Callable[[_Handler], _Handler]:
+        def decorator(func: _Handler) -> _Handler:
+            self.handlers[kind] = func
+            return func
+
+        return decorator
+
+    def list_tools(self) -> Callable[[_Handler], _Handler]:
+        return self._record("list_tools")
+
+    def call_tool(self) -> Callable[[_Handler], _Handler]:
+        return self._record("call_tool")
+
+
+class _StubRegistry:
+    """Tool registry stand-in returning a fixed result."""
+
+    def __init__(self, result: dict[str, Any]) -> None:
+        self.result = result
+
+    async def execute_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> dict[str, Any]:
+        return self.result
+
+
+def _call_tool_handler(server: MCPServer) -> _Handler:
+    recorder = _RecordingServer()
+    server._server = recorder
+    server.setup_handlers()
+    return recorder.handlers["call_tool"]
+
+
+async def test_call_tool_serializes_result(test_settings: Settings) -> None:
+    """Test the tool result is returned as indented JSON text."""
+    result = {
+        "success": True,
+        "data": [{"device_id": "device_001", "hostname": "estação-01"}],
+    }
+    server = MCPServer(test_settings)
+    server._registry = _StubRegistry(result)
+
+    content = await _call_tool_handler(server)("get_host_details", {})
+
+    assert len(content) == 1
+    assert content[0].type == "text"
+    assert content[0].text == (
+        "{\n"
+        '  "success": true,\n'
+        '  "data": [\n'
+        "    {\n"
+        '      "device_id": "device_001",\n'
+        '      "hostname": "estação-01"\n'
+        "    }\n"
+        "  ]\n"
+        "}"
+    )
+
+
+async def test_call_tool_before_initialize(test_settings: Settings) -> None:
+    """Test the handler reports when no tools are registered yet."""
+    server = MCPServer(test_settings)
+
+    content = await _call_tool_handler(server)("get_host_details", {})
+
+    assert content[0].text == "Server not initialized"
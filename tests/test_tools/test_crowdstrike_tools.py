@@ -7,247 +7,148 @@ This module tests all CrowdStrike tool implementations including:
 - Incident management (query, get details)
 """
 
-from unittest.mock import MagicMock
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, NamedTuple
+from unittest.mock import Mock, call
 
 import pytest
 
 from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
 from mcp_crowdstrike.tools.crowdstrike import detections, hosts, incidents
 
+# Everything here runs against in-memory mocks; anything slower than this
+# is hitting real I/O
+pytestmark = pytest.mark.timeout(1)
+
+# Tool entry points, bound once instead of looked up on the module per call
+_hosts_exec = hosts.execute_tool
+_detects_exec = detections.execute_tool
+_incidents_exec = incidents.execute_tool
+
+# Signatures of the modules' execute_tool and the conftest call_tool fixture
+ToolExecutor = Callable[
+    [CrowdStrikeProvider, str, Mapping[str, Any]], Awaitable[dict[str, Any]]
+]
+ToolCaller = Callable[[ToolExecutor, str, Mapping[str, Any]], Awaitable[dict[str, Any]]]
+
+# Read-only tool arguments shared across tests
+_DEFAULT_QUERY = MappingProxyType({"limit": 10, "offset": 0})
+_WINDOWS_HOSTS_QUERY = MappingProxyType(
+    {
+        "filter": "platform_name:'Windows'",
+        "limit": 5,
+        "sort": "hostname.asc",
+    }
+)
+_NEW_INCIDENTS_QUERY = MappingProxyType(
+    {
+        "filter": "status:'New'",
+        "limit": 50,
+        "sort": "start.desc",
+    }
+)
+
+# Expected Falcon API calls, compared against call_args_list
+_WINDOWS_HOSTS_CALL = call(
+    filter="platform_name:'Windows'",
+    limit=5,
+    offset=0,
+    sort="hostname.asc",
+)
+_NEW_INCIDENTS_CALL = call(
+    filter="status:'New'",
+    limit=50,
+    offset=0,
+    sort="start.desc",
+)
+_CONTAIN_CALL = call(action_name="contain", ids=["device-id-1"])
+_LIFT_CALL = call(action_name="lift_containment", ids=["device-id-1"])
+
 
 # Host Management Tool Tests
 class TestHostTools:
     """Tests for host management tools."""
 
-    @pytest.mark.asyncio
-    async def test_query_devices_by_filter_success(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
-        sample_device_data: dict,
-    ) -> None:
-        """Test successful device query."""
-        arguments = {"limit": 10, "offset": 0}
-
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "query_devices_by_filter",
-            arguments,
-        )
-
-        assert result["success"] is True
-        assert "device_ids" in result["data"]
-        assert len(result["data"]["device_ids"]) == len(sample_device_data["device_ids"])
-        assert result["metadata"]["total"] == len(sample_device_data["device_ids"])
-        mock_hosts_api.query_devices_by_filter.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_query_devices_by_filter_with_filter(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
+        call_tool: ToolCaller,
+        mock_hosts_api: SimpleNamespace,
     ) -> None:
         """Test device query with FQL filter."""
-        arguments = {
-            "filter": "platform_name:'Windows'",
-            "limit": 5,
-            "sort": "hostname.asc",
-        }
-
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
+        result = await call_tool(
+            _hosts_exec,
             "query_devices_by_filter",
-            arguments,
+            _WINDOWS_HOSTS_QUERY,
         )
 
         assert result["success"] is True
-        mock_hosts_api.query_devices_by_filter.assert_called_with(
-            filter="platform_name:'Windows'",
-            limit=5,
-            offset=0,
-            sort="hostname.asc",
-        )
+        assert mock_hosts_api.query_devices_by_filter.call_args_list == [
+            _WINDOWS_HOSTS_CALL
+        ]
 
-    @pytest.mark.asyncio
     async def test_query_devices_api_error(
         self,
         mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
+        call_tool: ToolCaller,
+        thaw: Callable[[Any], Any],
+        api_error_500: Mapping[str, Any],
     ) -> None:
         """Test device query with API error."""
-        mock_hosts_api.query_devices_by_filter.return_value = {
-            "status_code": 500,
-            "body": {"errors": ["Internal server error"]},
-        }
-
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "query_devices_by_filter",
-            {"limit": 10},
+        # Give this provider copy its own Hosts API so the session-wide
+        # mock is never reconfigured
+        hosts_api = SimpleNamespace(
+            query_devices_by_filter=Mock(return_value=thaw(api_error_500))
         )
+        mock_crowdstrike_provider._hosts = hosts_api
 
-        assert result["success"] is False
-        assert result["status_code"] == 500
-
-    @pytest.mark.asyncio
-    async def test_get_device_details_success(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
-        sample_device_data: dict,
-    ) -> None:
-        """Test successful device details retrieval."""
-        device_ids = sample_device_data["device_ids"][:2]
-        arguments = {"device_ids": device_ids}
-
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "get_device_details",
-            arguments,
-        )
-
-        assert result["success"] is True
-        assert "devices" in result["data"]
-        assert len(result["data"]["devices"]) == len(sample_device_data["devices"])
-        mock_hosts_api.get_device_details.assert_called_once_with(ids=device_ids)
-
-    @pytest.mark.asyncio
-    async def test_get_device_details_missing_ids(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-    ) -> None:
-        """Test device details with missing device IDs."""
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "get_device_details",
-            {"device_ids": []},
-        )
+        result = await call_tool(_hosts_exec, "query_devices_by_filter", _DEFAULT_QUERY)
 
         assert result["success"] is False
-        assert "device_ids" in str(result["error"]).lower()
+        assert result["status_code"] == 500
+        hosts_api.query_devices_by_filter.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_contain_host_success(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
+        call_tool: ToolCaller,
+        mock_hosts_api: SimpleNamespace,
     ) -> None:
         """Test successful host containment."""
         device_id = "device-id-1"
         arguments = {"device_id": device_id}
 
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "contain_host",
-            arguments,
-        )
+        result = await call_tool(_hosts_exec, "contain_host", arguments)
 
         assert result["success"] is True
         assert result["data"]["device_id"] == device_id
         assert result["data"]["action"] == "contained"
-        mock_hosts_api.perform_action.assert_called_once_with(
-            action_name="contain",
-            ids=[device_id],
-        )
+        assert mock_hosts_api.perform_action.call_args_list == [_CONTAIN_CALL]
 
-    @pytest.mark.asyncio
-    async def test_contain_host_missing_id(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-    ) -> None:
-        """Test host containment with missing device ID."""
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "contain_host",
-            {},
-        )
-
-        assert result["success"] is False
-        assert "device_id" in str(result["error"]).lower()
-
-    @pytest.mark.asyncio
     async def test_lift_containment_success(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_hosts_api: MagicMock,
+        call_tool: ToolCaller,
+        mock_hosts_api: SimpleNamespace,
     ) -> None:
         """Test successful containment lift."""
         device_id = "device-id-1"
         arguments = {"device_id": device_id}
 
-        result = await hosts.execute_tool(
-            mock_crowdstrike_provider,
-            "lift_containment",
-            arguments,
-        )
+        result = await call_tool(_hosts_exec, "lift_containment", arguments)
 
         assert result["success"] is True
         assert result["data"]["device_id"] == device_id
         assert result["data"]["action"] == "containment_lifted"
-        mock_hosts_api.perform_action.assert_called_once_with(
-            action_name="lift_containment",
-            ids=[device_id],
-        )
+        assert mock_hosts_api.perform_action.call_args_list == [_LIFT_CALL]
 
 
 # Detection Management Tool Tests
 class TestDetectionTools:
     """Tests for detection management tools."""
 
-    @pytest.mark.asyncio
-    async def test_query_detections_success(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_detects_api: MagicMock,
-        sample_detection_data: dict,
-    ) -> None:
-        """Test successful detection query."""
-        arguments = {"limit": 100, "offset": 0}
-
-        result = await detections.execute_tool(
-            mock_crowdstrike_provider,
-            "query_detections",
-            arguments,
-        )
-
-        assert result["success"] is True
-        assert "detection_ids" in result["data"]
-        assert len(result["data"]["detection_ids"]) == len(
-            sample_detection_data["detection_ids"]
-        )
-        mock_detects_api.query_detects.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_detection_details_success(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_detects_api: MagicMock,
-        sample_detection_data: dict,
-    ) -> None:
-        """Test successful detection details retrieval."""
-        detection_ids = sample_detection_data["detection_ids"]
-        arguments = {"detection_ids": detection_ids}
-
-        result = await detections.execute_tool(
-            mock_crowdstrike_provider,
-            "get_detection_details",
-            arguments,
-        )
-
-        assert result["success"] is True
-        assert "detections" in result["data"]
-        assert len(result["data"]["detections"]) == len(
-            sample_detection_data["detections"]
-        )
-        mock_detects_api.get_detect_summaries.assert_called_once_with(
-            ids=detection_ids
-        )
-
-    @pytest.mark.asyncio
     async def test_update_detection_status_success(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_detects_api: MagicMock,
+        call_tool: ToolCaller,
+        mock_detects_api: SimpleNamespace,
     ) -> None:
         """Test successful detection status update."""
         detection_ids = ["ldt:detection-id-1"]
@@ -257,21 +158,16 @@ class TestDetectionTools:
             "comment": "Test comment",
         }
 
-        result = await detections.execute_tool(
-            mock_crowdstrike_provider,
-            "update_detection_status",
-            arguments,
-        )
+        result = await call_tool(_detects_exec, "update_detection_status", arguments)
 
         assert result["success"] is True
         assert result["data"]["updated_count"] == len(detection_ids)
         assert result["data"]["status"] == "false_positive"
         mock_detects_api.update_detects_by_ids.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_detection_status_invalid_status(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
+        call_tool: ToolCaller,
     ) -> None:
         """Test detection update with invalid status."""
         arguments = {
@@ -279,156 +175,232 @@ class TestDetectionTools:
             "status": "invalid_status",
         }
 
-        result = await detections.execute_tool(
-            mock_crowdstrike_provider,
-            "update_detection_status",
-            arguments,
-        )
-
-        assert result["success"] is False
-        assert "status" in str(result["error"]).lower()
-
-    @pytest.mark.asyncio
-    async def test_update_detection_status_missing_ids(
-        self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-    ) -> None:
-        """Test detection update with missing IDs."""
-        arguments = {
-            "detection_ids": [],
-            "status": "new",
-        }
-
-        result = await detections.execute_tool(
-            mock_crowdstrike_provider,
-            "update_detection_status",
-            arguments,
-        )
+        result = await call_tool(_detects_exec, "update_detection_status", arguments)
 
         assert result["success"] is False
+        assert result["details"]["field"] == "status"
 
 
 # Incident Management Tool Tests
 class TestIncidentTools:
     """Tests for incident management tools."""
 
-    @pytest.mark.asyncio
-    async def test_query_incidents_success(
+    async def test_query_incidents_with_filter(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_incidents_api: MagicMock,
-        sample_incident_data: dict,
+        call_tool: ToolCaller,
+        mock_incidents_api: SimpleNamespace,
     ) -> None:
-        """Test successful incident query."""
-        arguments = {"limit": 100, "offset": 0}
-
-        result = await incidents.execute_tool(
-            mock_crowdstrike_provider,
+        """Test incident query with filter."""
+        result = await call_tool(
+            _incidents_exec,
             "query_incidents",
-            arguments,
+            _NEW_INCIDENTS_QUERY,
         )
 
         assert result["success"] is True
-        assert "incident_ids" in result["data"]
-        assert len(result["data"]["incident_ids"]) == len(
-            sample_incident_data["incident_ids"]
-        )
-        mock_incidents_api.query_incidents.assert_called_once()
+        assert mock_incidents_api.query_incidents.call_args_list == [
+            _NEW_INCIDENTS_CALL
+        ]
 
-    @pytest.mark.asyncio
-    async def test_query_incidents_with_filter(
+
+class _QueryCase(NamedTuple):
+    """Query tool and the mocked API call it should make."""
+
+    execute: ToolExecutor
+    tool_name: str
+    api_fixture: str
+    api_method: str
+    sample_fixture: str
+    id_key: str
+
+
+class _DetailsCase(NamedTuple):
+    """Details tool, its mocked API call and the response keys it uses."""
+
+    execute: ToolExecutor
+    tool_name: str
+    api_fixture: str
+    api_method: str
+    sample_fixture: str
+    id_key: str
+    data_key: str
+
+
+class _MissingIdsCase(NamedTuple):
+    """Tool call missing its required IDs and the field it should reject."""
+
+    execute: ToolExecutor
+    tool_name: str
+    arguments: Mapping[str, Any]
+    err_field: str
+
+
+_QUERY_CASES = [
+    pytest.param(
+        _QueryCase(
+            _hosts_exec,
+            "query_devices_by_filter",
+            "mock_hosts_api",
+            "query_devices_by_filter",
+            "sample_device_data",
+            "device_ids",
+        ),
+        id="hosts",
+    ),
+    pytest.param(
+        _QueryCase(
+            _detects_exec,
+            "query_detections",
+            "mock_detects_api",
+            "query_detects",
+            "sample_detection_data",
+            "detection_ids",
+        ),
+        id="detections",
+    ),
+    pytest.param(
+        _QueryCase(
+            _incidents_exec,
+            "query_incidents",
+            "mock_incidents_api",
+            "query_incidents",
+            "sample_incident_data",
+            "incident_ids",
+        ),
+        id="incidents",
+    ),
+]
+
+_DETAILS_CASES = [
+    pytest.param(
+        _DetailsCase(
+            _hosts_exec,
+            "get_device_details",
+            "mock_hosts_api",
+            "get_device_details",
+            "sample_device_data",
+            "device_ids",
+            "devices",
+        ),
+        id="hosts",
+    ),
+    pytest.param(
+        _DetailsCase(
+            _detects_exec,
+            "get_detection_details",
+            "mock_detects_api",
+            "get_detect_summaries",
+            "sample_detection_data",
+            "detection_ids",
+            "detections",
+        ),
+        id="detections",
+    ),
+    pytest.param(
+        _DetailsCase(
+            _incidents_exec,
+            "get_incident_details",
+            "mock_incidents_api",
+            "get_incidents",
+            "sample_incident_data",
+            "incident_ids",
+            "incidents",
+        ),
+        id="incidents",
+    ),
+]
+
+_MISSING_IDS_CASES = [
+    pytest.param(
+        _MissingIdsCase(
+            _hosts_exec,
+            "get_device_details",
+            MappingProxyType({"device_ids": []}),
+            "device_ids",
+        ),
+        id="get_device_details",
+    ),
+    pytest.param(
+        _MissingIdsCase(
+            _hosts_exec,
+            "contain_host",
+            MappingProxyType({}),
+            "device_id",
+        ),
+        id="contain_host",
+    ),
+    pytest.param(
+        _MissingIdsCase(
+            _detects_exec,
+            "update_detection_status",
+            MappingProxyType({"detection_ids": [], "status": "new"}),
+            "detection_ids",
+        ),
+        id="update_detection_status",
+    ),
+    pytest.param(
+        _MissingIdsCase(
+            _incidents_exec,
+            "get_incident_details",
+            MappingProxyType({"incident_ids": []}),
+            "incident_ids",
+        ),
+        id="get_incident_details",
+    ),
+]
+
+
+# Tests shared by the query, details and ID-based tools
+class TestSharedToolBehavior:
+    """Tests run against every resource type's tools."""
+
+    @pytest.mark.parametrize("case", _QUERY_CASES)
+    async def test_query_success(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_incidents_api: MagicMock,
+        request: pytest.FixtureRequest,
+        call_tool: ToolCaller,
+        case: _QueryCase,
     ) -> None:
-        """Test incident query with filter."""
-        arguments = {
-            "filter": "status:'New'",
-            "limit": 50,
-            "sort": "start.desc",
-        }
+        """Test successful ID queries for every resource type."""
+        api_call = getattr(request.getfixturevalue(case.api_fixture), case.api_method)
+        sample_data: Mapping[str, Any] = request.getfixturevalue(case.sample_fixture)
 
-        result = await incidents.execute_tool(
-            mock_crowdstrike_provider,
-            "query_incidents",
-            arguments,
-        )
+        result = await call_tool(case.execute, case.tool_name, _DEFAULT_QUERY)
 
         assert result["success"] is True
-        mock_incidents_api.query_incidents.assert_called_with(
-            filter="status:'New'",
-            limit=50,
-            offset=0,
-            sort="start.desc",
-        )
+        assert result["data"][case.id_key] == list(sample_data[case.id_key])
+        assert result["metadata"]["total"] == len(sample_data[case.id_key])
+        api_call.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_incident_details_success(
+    @pytest.mark.parametrize("case", _DETAILS_CASES)
+    async def test_get_details_success(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
-        mock_incidents_api: MagicMock,
-        sample_incident_data: dict,
+        request: pytest.FixtureRequest,
+        call_tool: ToolCaller,
+        thaw: Callable[[Any], Any],
+        case: _DetailsCase,
     ) -> None:
-        """Test successful incident details retrieval."""
-        incident_ids = sample_incident_data["incident_ids"]
-        arguments = {"incident_ids": incident_ids}
+        """Test successful details retrieval for every resource type."""
+        api_call = getattr(request.getfixturevalue(case.api_fixture), case.api_method)
+        sample_data: Mapping[str, Any] = request.getfixturevalue(case.sample_fixture)
+        ids = list(sample_data[case.id_key])
+        arguments = {case.id_key: ids}
 
-        result = await incidents.execute_tool(
-            mock_crowdstrike_provider,
-            "get_incident_details",
-            arguments,
-        )
+        result = await call_tool(case.execute, case.tool_name, arguments)
 
+        records = result["data"][case.data_key]
         assert result["success"] is True
-        assert "incidents" in result["data"]
-        assert len(result["data"]["incidents"]) == len(
-            sample_incident_data["incidents"]
-        )
-        mock_incidents_api.get_incidents.assert_called_once_with(ids=incident_ids)
+        assert records == thaw(sample_data[case.data_key])
+        api_call.assert_called_once_with(ids=ids)
 
-    @pytest.mark.asyncio
-    async def test_get_incident_details_missing_ids(
+    @pytest.mark.parametrize("case", _MISSING_IDS_CASES)
+    async def test_missing_ids(
         self,
-        mock_crowdstrike_provider: CrowdStrikeProvider,
+        call_tool: ToolCaller,
+        case: _MissingIdsCase,
     ) -> None:
-        """Test incident details with missing IDs."""
-        result = await incidents.execute_tool(
-            mock_crowdstrike_provider,
-            "get_incident_details",
-            {"incident_ids": []},
-        )
+        """Test tools reject calls without the required IDs."""
+        result = await call_tool(case.execute, case.tool_name, case.arguments)
 
         assert result["success"] is False
-        assert "incident_ids" in str(result["error"]).lower()
-
-
-# Tool Registry Tests
-class TestToolRegistration:
-    """Tests for tool registration and discovery."""
-
-    def test_hosts_get_tools(self) -> None:
-        """Test hosts module tool registration."""
-        tools = hosts.get_tools()
-        assert len(tools) == 4
-        tool_names = [t.name for t in tools]
-        assert "query_devices_by_filter" in tool_names
-        assert "get_device_details" in tool_names
-        assert "contain_host" in tool_names
-        assert "lift_containment" in tool_names
-
-    def test_detections_get_tools(self) -> None:
-        """Test detections module tool registration."""
-        tools = detections.get_tools()
-        assert len(tools) == 3
-        tool_names = [t.name for t in tools]
-        assert "query_detections" in tool_names
-        assert "get_detection_details" in tool_names
-        assert "update_detection_status" in tool_names
-
-    def test_incidents_get_tools(self) -> None:
-        """Test incidents module tool registration."""
-        tools = incidents.get_tools()
-        assert len(tools) == 2
-        tool_names = [t.name for t in tools]
-        assert "query_incidents" in tool_names
-        assert "get_incident_details" in tool_names
+        assert result["details"]["field"] == case.err_field
@@ -0,0 +1,69 @@
+"""
+Tests for CrowdStrike tool registration and discovery.
+
+These tests are synchronous and only inspect the static tool definitions
+and how the registry binds them.
+"""
+
+from mcp_crowdstrike.providers.crowdstrike import CrowdStrikeProvider
+from mcp_crowdstrike.tools.crowdstrike import detections, hosts, incidents
+from mcp_crowdstrike.tools.registry import ToolRegistry
+
+# Tool names each module is expected to expose
+_HOST_TOOLS = frozenset(
+    {
+        "query_devices_by_filter",
+        "get_device_details",
+        "contain_host",
+        "lift_containment",
+    }
+)
+_DETECTION_TOOLS = frozenset(
+    {
+        "query_detections",
+        "get_detection_details",
+        "update_detection_status",
+    }
+)
+_INCIDENT_TOOLS = frozenset({"query_incidents", "get_incident_details"})
+
+
+class TestToolRegistration:
+    """Tests for tool registration and discovery."""
+
+    def test_hosts_get_tools(self) -> None:
+        """Test hosts module tool registration."""
+        tools = hosts.get_tools()
+        assert len(tools) == len(_HOST_TOOLS)
+        assert {t.name for t in tools} == _HOST_TOOLS
+
+    def test_detections_get_tools(self) -> None:
+        """Test detections module tool registration."""
+        tools = detections.get_tools()
+        assert len(tools) == len(_DETECTION_TOOLS)
+        assert {t.name for t in tools} == _DETECTION_TOOLS
+
+    def test_incidents_get_tools(self) -> None:
+        """Test incidents module tool registration."""
+        tools = incidents.get_tools()
+        assert len(tools) == len(_INCIDENT_TOOLS)
+        assert {t.name for t in tools} == _INCIDENT_TOOLS
+
+    def test_get_tools_is_cached(self) -> None:
+        """Test tool definitions are built once per module."""
+        assert hosts.get_tools() is hosts.get_tools()
+        assert detections.get_tools() is detections.get_tools()
+        assert incidents.get_tools() is incidents.get_tools()
+
+    def test_register_module_keeps_cached_tools(
+        self,
+        mock_crowdstrike_provider: CrowdStrikeProvider,
+    ) -> None:
+        """Test registering a module does not rebind its cached tools."""
+        handler = hosts.get_tools()[0].handler
+        registry = ToolRegistry(mock_crowdstrike_provider)
+
+        registry.register_module(hosts.get_tools, hosts.execute_tool)
+
+        assert hosts.get_tools()[0].handler is handler
+        assert registry.get_tool(hosts.get_tools()[0].name).handler is not handler